@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2024 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import subprocess
+import sys
+
+import pytest
+
+import pyaedt
+
+
+def test_lazy_import_is_cached():
+    settings = pyaedt.settings
+
+    assert pyaedt.__dict__["settings"] is settings
+    assert pyaedt.settings is settings
+
+
+def test_lazy_import_module():
+    from pyaedt.generic import constants
+
+    assert pyaedt.constants is constants
+
+
+def test_lazy_import_unknown_name():
+    with pytest.raises(AttributeError, match="has no attribute 'not_a_pyaedt_name'") as error:
+        pyaedt.not_a_pyaedt_name
+
+    assert error.value.__cause__ is None
+    assert error.value.__context__ is None
+
+
+def test_dir_lists_lazy_names():
+    names = dir(pyaedt)
+
+    assert "Hfss" in names
+    assert "launch_desktop" in names
+    assert "__version__" in names
+
+
+def test_star_import_exports_lazy_names():
+    namespace = {}
+    exec("from pyaedt import *", namespace)
+
+    assert namespace["Hfss"] is pyaedt.Hfss
+    assert namespace["generate_unique_name"] is pyaedt.generate_unique_name
+    assert namespace["version"] == pyaedt.__version__
+    assert "deprecation_warning" in namespace
+    assert "_retry_ntimes" not in namespace
+
+
+def test_import_does_not_load_heavy_modules():
+    code = (
+        "import sys; import pyaedt; "
+        "assert 'pyaedt.generic.design_types' not in sys.modules; "
+        "assert 'pyaedt.edb' not in sys.modules; "
+        "assert 'pyaedt.generic.general_methods' not in sys.modules"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)  # nosec
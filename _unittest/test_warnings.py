@@ -45,3 +45,14 @@ def test_deprecation_warning(mock_warn):
         mock_warn.assert_called_once_with(expected, PendingDeprecationWarning)
     else:
         mock_warn.assert_not_called()
+
+
+@patch.object(warnings, "warn")
+def test_deprecation_warning_restores_showwarning(mock_warn):
+    existing_showwarning = warnings.showwarning
+
+    with patch("pyaedt.LATEST_DEPRECATED_PYTHON_VERSION", sys.version_info[:2]):
+        deprecation_warning()
+
+    mock_warn.assert_called_once()
+    assert warnings.showwarning is existing_showwarning
@@ -30,6 +30,10 @@ This continues until the maximum frequency in the desired range is achieved.
 
 import sys
 import os
+from functools import wraps
+import hashlib
+import inspect
+import numpy as np
 import pyaedt
 
 # Create a temporary folder to download the example to.
@@ -75,54 +79,183 @@ hfss = pyaedt.Hfss(project=project_path, non_graphical=non_graphical)
 # eigenmode solver needs to converge on modes. ``fmin`` is the lowest frequency
 # of interest. ``fmax`` is the highest frequency of interest.
 # ``limit`` is the parameter limit that determines which modes are ignored.
+# ``num_cores`` is the number of cores that each analysis uses. The analyses run one
+# after the other in the same AEDT session, so all the cores go to a single analysis.
+# ``max_delta_freq`` is the maximum change of frequency in percent between two adaptive
+# passes for an analysis to converge.
+# Because each analysis starts from the last mode of the previous one, the same
+# mode can be found twice. ``tolerance`` is the relative frequency difference
+# below which two modes are considered the same. Two analyses only agree within their
+# convergence criterion, so it is derived from ``max_delta_freq``.
+# When ``coarse_scan`` is ``True``, each frequency window is first solved with only
+# a couple of adaptive passes. Windows whose modes all have a Q lower than half of
+# ``limit`` cannot contain physical modes and are skipped without the full analysis.
+# When ``reuse_mesh`` is ``True``, each setup imports the mesh of the last full analysis,
+# so fewer adaptive passes are needed to converge when the mesh link succeeds.
+# When ``adapt_num_modes`` is ``True``, the number of modes of the next analysis is
+# estimated from the mode density of the last one, between ``3`` and ``max_num_modes``,
+# so that sparse regions are solved with fewer modes and dense regions with fewer setups.
+# When ``use_cache`` is ``True``, the results of each analysis are stored in ``cache_folder``
+# and reused when the script is run again on the same project with the same settings.
+# It is disabled by default so that the example does not write outside its temporary folder.
 
 num_modes = 6
 fmin = 1
 fmax = 2
 next_fmin = fmin
 setup_nr = 1
+num_cores = 8
 
 limit = 10
-resonance = {}
+max_delta_freq = 5
+tolerance = max_delta_freq / 100
+coarse_scan = True
+reuse_mesh = True
+last_full_setup = None
+adapt_num_modes = True
+max_num_modes = 10
+use_cache = False
+cache_folder = os.path.join(os.path.expanduser("~"), ".cache", "pyaedt", "eigenmode")
+resonance_q = []
+resonance_f = []
+
+
+###############################################################################
+# Cache the results
+# ~~~~~~~~~~~~~~~~~
+# The following cell defines a decorator that stores the modes found by an analysis on disk.
+# The cache key is a hash of the project file content, of all the arguments of
+# ``find_resonance`` including their defaults, and of the key of the analysis whose mesh
+# is imported. Modifying the project or any of these parameters invalidates the stored
+# results. The setup name is not part of the key because it does not change the results.
+# When the requested mesh cannot be imported, for example because its setup was read from
+# the cache, the results are looked up and stored as those of an analysis without mesh link.
+
+project_checksum = None
+cache_stats = {"hits": 0, "misses": 0}
+cache_keys = {}
+linked_setups = set()
+
+
+def resonance_cache_key(arguments, mesh_setup):
+    global project_checksum
+    if project_checksum is None:
+        with open(project_path, "rb") as f:
+            project_checksum = hashlib.blake2b(f.read()).hexdigest()
+    parameters = dict(arguments, mesh_setup=cache_keys.get(mesh_setup))
+    del parameters["setup_name"]
+    key = repr((project_checksum, sorted(parameters.items())))
+    return hashlib.blake2b(key.encode()).hexdigest()
+
+
+def cached_resonance(func):
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        if not use_cache:
+            return func(*args, **kwargs)
+        arguments = inspect.signature(func).bind(*args, **kwargs)
+        arguments.apply_defaults()
+        setup_name = arguments.arguments["setup_name"]
+        mesh_setup = arguments.arguments["mesh_setup"]
+        key = resonance_cache_key(arguments.arguments, mesh_setup)
+        cache_file = os.path.join(cache_folder, key + ".npz")
+        if not os.path.exists(cache_file) and mesh_setup not in hfss.setup_names:
+            # The mesh cannot be imported, so the analysis runs without mesh link.
+            key = resonance_cache_key(arguments.arguments, None)
+            cache_file = os.path.join(cache_folder, key + ".npz")
+        if os.path.exists(cache_file):
+            cache_stats["hits"] += 1
+            cache_keys[setup_name] = key
+            with np.load(cache_file) as cached:
+                return cached["q"], cached["f"]
+        cache_stats["misses"] += 1
+        q_arr, f_arr = func(*args, **kwargs)
+        if setup_name not in linked_setups:
+            key = resonance_cache_key(arguments.arguments, None)
+        cache_keys[setup_name] = key
+        os.makedirs(cache_folder, exist_ok=True)
+        np.savez(os.path.join(cache_folder, key + ".npz"), q=q_arr, f=f_arr)
+        return q_arr, f_arr
+
+    return wrapper
+
+
+###############################################################################
+# Get the report quantities
+# ~~~~~~~~~~~~~~~~~~~~~~~~~
+# The names of the eigenmode quantities only depend on the number of modes, so they are
+# retrieved once from AEDT and reused for all the setups having the same number of modes.
+
+quantities = {}
+
+
+def available_quantities(setup_name, modes, category=None):
+    key = (modes, category)
+    if key not in quantities:
+        quantities[key] = hfss.post.available_report_quantities(solution=setup_name + ' : LastAdaptive',
+                                                                quantities_category=category)
+    return quantities[key]
 
 
 ###############################################################################
 # Find the modes
 # ~~~~~~~~~~~~~~
-# The following cell is a function.  If called, it creates an eigenmode setup and solves it.
-# After the solve, each mode, along with its corresponding real frequency and quality factor,
-# are saved for further processing.
+# The following cell is a function.  If called, it creates an eigenmode setup named ``setup_name``
+# that searches ``modes`` modes above ``min_freq`` (in GHz) and solves it
+# with the given number of adaptive passes. If ``mesh_setup`` is the name of an existing
+# setup, its mesh is imported and the number of passes is reduced to ``warm_max_passes``
+# and ``warm_min_passes``.
+# After the solve, the quality factor and the real frequency of each mode
+# are returned as two arrays for further processing.
 
-def find_resonance():
+@cached_resonance
+def find_resonance(setup_name, min_freq, modes, max_passes=10, min_passes=3, mesh_setup=None, warm_max_passes=5,
+                   warm_min_passes=2, max_delta_freq=5, converge_on_real_freq=True):
     # setup creation
-    next_min_freq = str(next_fmin) + " GHz"
-    setup_name = "em_setup" + str(setup_nr)
     setup = hfss.create_setup(setup_name)
-    setup.props['MinimumFrequency'] = next_min_freq
-    setup.props['NumModes'] = num_modes
-    setup.props['ConvergeOnRealFreq'] = True
-    setup.props['MaximumPasses'] = 10
-    setup.props['MinimumPasses'] = 3
-    setup.props['MaxDeltaFreq'] = 5
+    setup.props['MinimumFrequency'] = str(min_freq) + " GHz"
+    setup.props['NumModes'] = modes
+    setup.props['ConvergeOnRealFreq'] = converge_on_real_freq
+    setup.props['MaxDeltaFreq'] = max_delta_freq
+    # The mesh setup does not exist when its results were read from the cache.
+    if mesh_setup in hfss.setup_names and setup.add_mesh_link(design=hfss.design_name,
+                                                              solution=mesh_setup + ' : LastAdaptive'):
+        # The imported mesh is already refined, so the solver converges in fewer passes.
+        linked_setups.add(setup_name)
+        max_passes = min(max_passes, warm_max_passes)
+        min_passes = min(min_passes, warm_min_passes)
+    setup.props['MaximumPasses'] = max_passes
+    setup.props['MinimumPasses'] = min_passes
     # analyzing the eigenmode setup
-    hfss.analyze_setup(setup_name, cores=8, use_auto_settings=True)
+    hfss.analyze_setup(setup_name, cores=num_cores, use_auto_settings=True)
     # getting the Q and real frequency of each mode
-    eigen_q = hfss.post.available_report_quantities(quantities_category="Eigen Q")
-    eigen_mode = hfss.post.available_report_quantities()
-    data = {}
-    cont = 0
-    for i in eigen_mode:
-        eigen_q_value = hfss.post.get_solution_data(expressions=eigen_q[cont],
-                                                    setup_sweep_name=setup_name + ' : LastAdaptive',
-                                                    report_category="Eigenmode")
-        eigen_mode_value = hfss.post.get_solution_data(expressions=eigen_mode[cont],
-                                                       setup_sweep_name=setup_name + ' : LastAdaptive',
-                                                       report_category="Eigenmode")
-        data[cont] = [eigen_q_value.data_real()[0], eigen_mode_value.data_real()[0]]
-        cont += 1
-
-    print(data)
-    return data
+    eigen_q = available_quantities(setup_name, modes, "Eigen Q")
+    eigen_mode = available_quantities(setup_name, modes)
+    # Q and frequency of all the modes are retrieved together in a single request.
+    eigen_values = hfss.post.get_solution_data(expressions=eigen_q + eigen_mode,
+                                               setup_sweep_name=setup_name + ' : LastAdaptive',
+                                               report_category="Eigenmode")
+    q_arr = np.array([eigen_values.data_real(expression)[0] for expression in eigen_q])
+    f_arr = np.array([eigen_values.data_real(expression)[0] for expression in eigen_mode])
+
+    print(q_arr, f_arr)
+    return q_arr, f_arr
+
+
+###############################################################################
+# Estimate the number of modes
+# ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+# The following cell is a function. If called, it returns the number of modes expected
+# between the last mode found and ``fmax``, based on the average spacing of the modes
+# of the last analysis.
+
+def estimate_num_modes(f_arr):
+    # The spacing cannot be estimated from a single mode or from degenerate modes.
+    df = f_arr[-1] - f_arr[0]
+    if df <= 0:
+        return num_modes
+    expected_modes = (len(f_arr) - 1) * (fmax * 1e9 - f_arr[-1]) / df
+    return int(np.clip(np.ceil(expected_modes) + 1, 3, max_num_modes))
 
 
 ###############################################################################
@@ -133,17 +266,36 @@ def find_resonance():
 # When the automation ends, the physical modes in the whole frequency range are reported.
 
 while next_fmin < fmax:
-    output = find_resonance()
-    next_fmin = output[len(output) - 1][1] / 1e9
+    mesh_setup = last_full_setup if reuse_mesh else None
+    if coarse_scan:
+        q_arr, f_arr = find_resonance("em_setup" + str(setup_nr), next_fmin, num_modes, max_passes=2, min_passes=1,
+                                      mesh_setup=mesh_setup, max_delta_freq=max_delta_freq)
+        setup_nr += 1
+        # Without any coarse mode, the full analysis decides whether modes remain.
+        if q_arr.size and q_arr.max() < limit / 2:
+            next_fmin = f_arr[-1] / 1e9
+            continue
+    last_full_setup = "em_setup" + str(setup_nr)
+    q_arr, f_arr = find_resonance(last_full_setup, next_fmin, num_modes, mesh_setup=mesh_setup,
+                                  max_delta_freq=max_delta_freq)
+    if not f_arr.size:
+        raise RuntimeError(f"No eigenmode found above {next_fmin} GHz.")
+    next_fmin = f_arr[-1] / 1e9
     setup_nr += 1
-    cont_res = len(resonance)
-    for q in output:
-        if output[q][0] > limit:
-            resonance[cont_res] = output[q]
-            cont_res += 1
+    if adapt_num_modes:
+        num_modes = estimate_num_modes(f_arr)
+    mask = q_arr > limit
+    if resonance_f:
+        mask &= np.abs(f_arr - resonance_f[-1]) >= tolerance * f_arr
+    resonance_q.extend(q_arr[mask])
+    resonance_f.extend(f_arr[mask])
 
-resonance_frequencies = [f"{resonance[i][1] / 1e9:.5} GHz" for i in resonance]
+resonance_q = np.array(resonance_q)
+resonance_f = np.array(resonance_f)
+resonance_frequencies = [f"{x / 1e9:.5g} GHz" for x in resonance_f]
 print(str(resonance_frequencies))
+if use_cache:
+    print(f"Cache hits: {cache_stats['hits']}, misses: {cache_stats['misses']}")
 
 ###############################################################################
 # Save project
@@ -22,6 +22,7 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import importlib
 import os
 import sys
 import warnings
@@ -34,6 +35,10 @@ LATEST_DEPRECATED_PYTHON_VERSION = (3, 7)
 
 def deprecation_warning():
     """Warning message informing users that some Python versions are deprecated in PyAEDT."""
+    current_version = sys.version_info[:2]
+    if current_version > LATEST_DEPRECATED_PYTHON_VERSION:
+        return
+
     # Store warnings showwarning
     existing_showwarning = warnings.showwarning
 
@@ -44,15 +49,13 @@ def deprecation_warning():
 
     warnings.showwarning = custom_show_warning
 
-    current_version = sys.version_info[:2]
-    if current_version <= LATEST_DEPRECATED_PYTHON_VERSION:
-        str_current_version = "{}.{}".format(*sys.version_info[:2])
-        warnings.warn(
-            "Current python version ({}) is deprecated in PyAEDT. We encourage you "
-            "to upgrade to the latest version to benefit from the latest features "
-            "and security updates.".format(str_current_version),
-            PendingDeprecationWarning,
-        )
+    str_current_version = "{}.{}".format(*current_version)
+    warnings.warn(
+        "Current python version ({}) is deprecated in PyAEDT. We encourage you "
+        "to upgrade to the latest version to benefit from the latest features "
+        "and security updates.".format(str_current_version),
+        PendingDeprecationWarning,
+    )
 
     # Restore warnings showwarning
     warnings.showwarning = existing_showwarning
@@ -66,42 +69,81 @@ pyaedt_path = os.path.dirname(__file__)
 __version__ = "0.10.dev0"
 version = __version__
 
-#
-if not ("IronPython" in sys.version or ".NETFramework" in sys.version):  # pragma: no cover
-    import pyaedt.downloads as downloads
-from pyaedt.edb import Edb  # nosec
-from pyaedt.edb import Siwave  # nosec
-from pyaedt.generic import constants
-import pyaedt.generic.DataHandlers as data_handler
-from pyaedt.generic.design_types import Circuit
-from pyaedt.generic.design_types import Desktop
-from pyaedt.generic.design_types import Emit
-from pyaedt.generic.design_types import Hfss
-from pyaedt.generic.design_types import Hfss3dLayout
-from pyaedt.generic.design_types import Icepak
-from pyaedt.generic.design_types import Maxwell2d
-from pyaedt.generic.design_types import Maxwell3d
-from pyaedt.generic.design_types import MaxwellCircuit
-from pyaedt.generic.design_types import Mechanical
-from pyaedt.generic.design_types import Q2d
-from pyaedt.generic.design_types import Q3d
-from pyaedt.generic.design_types import Rmxprt
-from pyaedt.generic.design_types import Simplorer
-from pyaedt.generic.design_types import TwinBuilder
-from pyaedt.generic.design_types import get_pyaedt_app
-from pyaedt.generic.design_types import launch_desktop
-import pyaedt.generic.general_methods as general_methods
-from pyaedt.generic.general_methods import _retry_ntimes
-from pyaedt.generic.general_methods import generate_unique_folder_name
-from pyaedt.generic.general_methods import generate_unique_name
-from pyaedt.generic.general_methods import generate_unique_project_name
-from pyaedt.generic.general_methods import inside_desktop
-from pyaedt.generic.general_methods import is_ironpython
-from pyaedt.generic.general_methods import is_linux
-from pyaedt.generic.general_methods import is_windows
-from pyaedt.generic.general_methods import online_help
-from pyaedt.generic.general_methods import pyaedt_function_handler
-from pyaedt.generic.general_methods import settings
-from pyaedt.misc import current_student_version
-from pyaedt.misc import current_version
-from pyaedt.misc import installed_versions
+# Public names of the package, in import order. Each entry gives the exposed name, its module
+# and its attribute. An attribute equal to ``None`` exposes the module itself.
+_LAZY_IMPORTS_ORDER = (
+    ("Edb", "pyaedt.edb", "Edb"),
+    ("Siwave", "pyaedt.edb", "Siwave"),
+    ("constants", "pyaedt.generic.constants", None),
+    ("data_handler", "pyaedt.generic.DataHandlers", None),
+    ("Circuit", "pyaedt.generic.design_types", "Circuit"),
+    ("Desktop", "pyaedt.generic.design_types", "Desktop"),
+    ("Emit", "pyaedt.generic.design_types", "Emit"),
+    ("Hfss", "pyaedt.generic.design_types", "Hfss"),
+    ("Hfss3dLayout", "pyaedt.generic.design_types", "Hfss3dLayout"),
+    ("Icepak", "pyaedt.generic.design_types", "Icepak"),
+    ("Maxwell2d", "pyaedt.generic.design_types", "Maxwell2d"),
+    ("Maxwell3d", "pyaedt.generic.design_types", "Maxwell3d"),
+    ("MaxwellCircuit", "pyaedt.generic.design_types", "MaxwellCircuit"),
+    ("Mechanical", "pyaedt.generic.design_types", "Mechanical"),
+    ("Q2d", "pyaedt.generic.design_types", "Q2d"),
+    ("Q3d", "pyaedt.generic.design_types", "Q3d"),
+    ("Rmxprt", "pyaedt.generic.design_types", "Rmxprt"),
+    ("Simplorer", "pyaedt.generic.design_types", "Simplorer"),
+    ("TwinBuilder", "pyaedt.generic.design_types", "TwinBuilder"),
+    ("get_pyaedt_app", "pyaedt.generic.design_types", "get_pyaedt_app"),
+    ("launch_desktop", "pyaedt.generic.design_types", "launch_desktop"),
+    ("general_methods", "pyaedt.generic.general_methods", None),
+    ("_retry_ntimes", "pyaedt.generic.general_methods", "_retry_ntimes"),
+    ("generate_unique_folder_name", "pyaedt.generic.general_methods", "generate_unique_folder_name"),
+    ("generate_unique_name", "pyaedt.generic.general_methods", "generate_unique_name"),
+    ("generate_unique_project_name", "pyaedt.generic.general_methods", "generate_unique_project_name"),
+    ("inside_desktop", "pyaedt.generic.general_methods", "inside_desktop"),
+    ("is_ironpython", "pyaedt.generic.general_methods", "is_ironpython"),
+    ("is_linux", "pyaedt.generic.general_methods", "is_linux"),
+    ("is_windows", "pyaedt.generic.general_methods", "is_windows"),
+    ("online_help", "pyaedt.generic.general_methods", "online_help"),
+    ("pyaedt_function_handler", "pyaedt.generic.general_methods", "pyaedt_function_handler"),
+    ("settings", "pyaedt.generic.general_methods", "settings"),
+    ("current_student_version", "pyaedt.misc", "current_student_version"),
+    ("current_version", "pyaedt.misc", "current_version"),
+    ("installed_versions", "pyaedt.misc", "installed_versions"),
+)
+if "IronPython" in sys.version or ".NETFramework" in sys.version:  # pragma: no cover
+    _is_ironpython = True
+else:
+    _is_ironpython = False
+    _LAZY_IMPORTS_ORDER = (("downloads", "pyaedt.downloads", None),) + _LAZY_IMPORTS_ORDER
+_LAZY_IMPORTS = dict((name, (module_name, attribute)) for name, module_name, attribute in _LAZY_IMPORTS_ORDER)
+
+__all__ = [name for name in _LAZY_IMPORTS if not name.startswith("_")] + [
+    "LATEST_DEPRECATED_PYTHON_VERSION",
+    "deprecation_warning",
+    "pyaedt_path",
+    "version",
+]
+
+
+def __getattr__(name):
+    """Import a public name of the package on first access."""
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+    module_name, attribute = _LAZY_IMPORTS[name]
+    value = importlib.import_module(module_name)
+    if attribute:
+        value = getattr(value, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    """List the package attributes, including the ones not imported yet."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+# On CPython, public names are imported on first access (PEP 562) so that ``import pyaedt``
+# only loads the modules that are actually used. IronPython does not support module
+# ``__getattr__``, so all the names are imported eagerly there.
+if _is_ironpython:  # pragma: no cover
+    for _name, _module_name, _attribute in _LAZY_IMPORTS_ORDER:
+        __getattr__(_name)